@@ -2,10 +2,10 @@ import json
 from collections.abc import Callable, Mapping
 from typing import Any, Literal, TypeVar
 
-from pydantic_core import PydanticUndefined, PydanticUndefinedType
+from pydantic_core import PydanticUndefinedType
 
 from lionfuncs.data.to_dict import to_dict
-from lionfuncs.ln_undefined import LN_UNDEFINED, LionUndefinedType
+from lionfuncs.ln_undefined import LionUndefinedType
 from lionfuncs.parse.xml_parser import dict_to_xml
 
 T = TypeVar("T")
@@ -51,7 +51,43 @@ def _serialize_as(
         ) from e
 
 
+def _str_or_raise(input_: Any, /) -> str:
+    try:
+        return str(input_)
+    except Exception as e:
+        raise ValueError(
+            f"Could not convert input of type <{type(input_).__name__}> "
+            "to string"
+        ) from e
+
+
+def _empty_str(_: Any, /) -> str:
+    return ""
+
+
+# Exact-type handlers for the common inputs; anything else, including
+# subclasses, goes through the isinstance chain in _to_str_type.
+_TO_STR_DISPATCH: dict[type, Callable[[Any], str]] = {
+    str: lambda x: x,
+    bytes: lambda x: x.decode("utf-8", errors="replace"),
+    bytearray: lambda x: x.decode("utf-8", errors="replace"),
+    int: _str_or_raise,
+    float: _str_or_raise,
+    bool: _str_or_raise,
+    list: lambda x: _str_or_raise(x) if x else "",
+    set: lambda x: _str_or_raise(x) if x else "",
+    dict: lambda x: json.dumps(x) if x else "",
+    type(None): _empty_str,
+    LionUndefinedType: _empty_str,
+    PydanticUndefinedType: _empty_str,
+}
+
+
 def _to_str_type(input_: Any, /) -> str:
+    handler = _TO_STR_DISPATCH.get(type(input_))
+    if handler is not None:
+        return handler(input_)
+
     if input_ in [set(), [], {}]:
         return ""
 
@@ -69,13 +105,7 @@ def _to_str_type(input_: Any, /) -> str:
     if isinstance(input_, Mapping):
         return json.dumps(dict(input_))
 
-    try:
-        return str(input_)
-    except Exception as e:
-        raise ValueError(
-            f"Could not convert input of type <{type(input_).__name__}> "
-            "to string"
-        ) from e
+    return _str_or_raise(input_)
 
 
 def to_str(
@@ -143,12 +173,11 @@ def to_str(
 
 
 def _process_string(s: str, strip_lower: bool, chars: str | None) -> str:
-    if s in [LN_UNDEFINED, PydanticUndefined, None, [], {}]:
+    if not s:
         return ""
 
     if strip_lower:
-        s = s.lower()
-        s = s.strip(chars) if chars is not None else s.strip()
+        s = s.lower().strip(chars)
     return s
 
 
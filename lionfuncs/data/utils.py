@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from typing import Any
 
 
@@ -15,10 +16,10 @@ def is_homogeneous(
         True if all elements/values are of the same type, False otherwise.
     """
     if isinstance(iterables, list):
-        return all(isinstance(it, type_check) for it in iterables)
+        return _all_instances(iterables, type_check)
 
     elif isinstance(iterables, dict):
-        return all(isinstance(val, type_check) for val in iterables.values())
+        return _all_instances(iterables.values(), type_check)
 
     else:
         return isinstance(iterables, type_check)
@@ -51,10 +52,23 @@ def is_same_dtype(
 
     dtype = dtype or first_element_type
 
-    result = all(isinstance(element, dtype) for element in iterable)
+    result = _all_instances(iterable, dtype)
     return (result, dtype) if return_dtype else result
 
 
+def _all_instances(
+    iterable: Iterable[Any], type_check: type | tuple[type, ...]
+) -> bool:
+    """Check isinstance for every element, trying exact type matches first."""
+    # An identity check skips the MRO walk for homogeneous inputs; fall
+    # back to isinstance so subclasses are still accepted.
+    if isinstance(type_check, type) and all(
+        type(element) is type_check for element in iterable
+    ):
+        return True
+    return all(isinstance(element, type_check) for element in iterable)
+
+
 def is_structure_homogeneous(
     structure: Any, return_structure_type: bool = False
 ) -> bool | tuple[bool, type | None]:
@@ -128,7 +142,7 @@ def deep_update(
     """
     for key, value in update.items():
         if isinstance(value, dict) and key in original:
-            original[key] = deep_update(original.get(key, {}), value)
+            original[key] = deep_update(original[key], value)
         else:
             original[key] = value
     return original
@@ -1,5 +1,7 @@
 import logging
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -29,15 +31,19 @@ def clear_path(
         )
 
     exclude = exclude or []
-    exclude_pattern = re.compile("|".join(exclude)) if exclude else None
+    exclude_pattern = _compile_union(tuple(exclude)) if exclude else None
 
-    for file_path in path.iterdir():
-        if exclude_pattern and exclude_pattern.search(file_path.name):
+    with os.scandir(path) as it:
+        entries = list(it)
+
+    for entry in entries:
+        file_path = Path(entry.path)
+        if exclude_pattern and exclude_pattern.search(entry.name):
             logging.info(f"Excluded from deletion: {file_path}")
             continue
 
         try:
-            if file_path.is_dir():
+            if entry.is_dir():
                 if recursive:
                     clear_path(file_path, recursive=True, exclude=exclude)
                     file_path.rmdir()
@@ -50,3 +56,9 @@ def clear_path(
             logging.error(f"Permission denied when deleting {file_path}: {e}")
         except Exception as e:
             logging.error(f"Failed to delete {file_path}: {e}")
+
+
+@lru_cache(maxsize=256)
+def _compile_union(patterns: tuple[str, ...]) -> re.Pattern:
+    """Compile exclude patterns into a single cached alternation."""
+    return re.compile("|".join(patterns))
@@ -18,15 +18,30 @@ def copy_file(src: Path | str, dest: Path | str) -> None:
         OSError: If there's an OS-level error during the copy operation.
     """
     src_path, dest_path = Path(src), Path(dest)
-    if not src_path.is_file():
-        raise FileNotFoundError(f"{src_path} does not exist or is not a file.")
-
     try:
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
         copy2(src_path, dest_path)
-    except PermissionError as e:
+        return
+    except OSError as e:
+        # Only stat the source once the copy has failed.
+        if not src_path.is_file():
+            raise FileNotFoundError(
+                f"{src_path} does not exist or is not a file."
+            ) from e
+        error = e
+
+    if isinstance(error, FileNotFoundError):
+        # The source is a file, so the destination directory is missing.
+        try:
+            dest_path.parent.mkdir(parents=True, exist_ok=True)
+            copy2(src_path, dest_path)
+            return
+        except OSError as e:
+            error = e
+
+    if isinstance(error, PermissionError):
         raise PermissionError(
             f"Permission denied when copying {src_path} to {dest_path}"
-        ) from e
-    except OSError as e:
-        raise OSError(f"Failed to copy {src_path} to {dest_path}: {e}") from e
+        ) from error
+    raise OSError(
+        f"Failed to copy {src_path} to {dest_path}: {error}"
+    ) from error
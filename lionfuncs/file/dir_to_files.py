@@ -2,6 +2,8 @@ import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+from lionfuncs.file.utils import walk_files
+
 
 def dir_to_files(
     directory: str | Path,
@@ -37,9 +39,11 @@ def dir_to_files(
             f"The provided path is not a valid directory: {directory}"
         )
 
+    suffixes = frozenset(file_types) if file_types is not None else None
+
     def process_file(file_path: Path) -> Path | None:
         try:
-            if file_types is None or file_path.suffix in file_types:
+            if suffixes is None or file_path.suffix in suffixes:
                 return file_path
         except Exception as e:
             if ignore_errors:
@@ -52,9 +56,8 @@ def dir_to_files(
     try:
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             futures = [
-                executor.submit(process_file, f)
-                for f in directory_path.rglob("*")
-                if f.is_file()
+                executor.submit(process_file, Path(entry.path))
+                for entry in walk_files(directory_path)
             ]
             files = [
                 future.result()
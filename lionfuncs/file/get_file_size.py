@@ -1,5 +1,14 @@
+import errno
+import stat
 from pathlib import Path
 
+from lionfuncs.file.utils import walk_files
+
+# The errnos pathlib's is_file()/is_dir() treat as "no such path".
+_MISSING_PATH_ERRNOS = frozenset(
+    {errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP}
+)
+
 
 def get_file_size(path: Path | str) -> int:
     """
@@ -18,12 +27,21 @@ def get_file_size(path: Path | str) -> int:
     """
     path = Path(path)
     try:
-        if path.is_file():
-            return path.stat().st_size
-        elif path.is_dir():
-            return sum(
-                f.stat().st_size for f in path.rglob("*") if f.is_file()
-            )
+        try:
+            st = path.stat()
+        except OSError as e:
+            if e.errno not in _MISSING_PATH_ERRNOS:
+                raise
+            raise FileNotFoundError(f"{path} does not exist.") from e
+        except ValueError as e:
+            # e.g. an embedded NUL byte, which is_file()/is_dir() treat
+            # as a missing path
+            raise FileNotFoundError(f"{path} does not exist.") from e
+
+        if stat.S_ISREG(st.st_mode):
+            return st.st_size
+        elif stat.S_ISDIR(st.st_mode):
+            return sum(entry.stat().st_size for entry in walk_files(path))
         else:
             raise FileNotFoundError(f"{path} does not exist.")
     except PermissionError as e:
@@ -2,6 +2,22 @@ import re
 import sys
 from pathlib import Path
 
+_IS_WINDOWS = sys.platform.startswith("win")
+_DEFAULT_MAX_LENGTH = 260 if _IS_WINDOWS else 4096
+
+_WINDOWS_INVALID_CHARS = r'<>:"/\\|?*'
+_WINDOWS_INVALID_CHARS_RE = re.compile(
+    f"[{re.escape(_WINDOWS_INVALID_CHARS)}]"
+)
+_CONSECUTIVE_SLASHES_RE = re.compile(r"//+")
+_WHITESPACE_RE = re.compile(r"\s")
+
+_RESERVED_NAMES = frozenset(
+    {"CON", "PRN", "AUX", "NUL"}
+    | {f"COM{i}" for i in range(1, 10)}
+    | {f"LPT{i}" for i in range(1, 10)}
+)
+
 
 def is_valid_path(
     path: str | Path,
@@ -40,51 +56,28 @@ def is_valid_path(
         raise ValueError("Path cannot be an empty string.")
 
     issues = []
-    is_windows = sys.platform.startswith("win")
 
     # Common checks for both Windows and Unix-like systems
     if "\0" in path_str:
         issues.append("Path contains null character.")
 
     if not max_length:
-        max_length = 260 if is_windows else 4096
+        max_length = _DEFAULT_MAX_LENGTH
     if len(path_str) > max_length:
         issues.append(
             f"Path exceeds the maximum length of {max_length} characters."
         )
 
-    if is_windows:
+    if _IS_WINDOWS:
         # Windows-specific validation
-        invalid_chars = r'<>:"/\\|?*'
-        if re.search(f"[{re.escape(invalid_chars)}]", path_str):
-            issues.append(f"Path contains invalid characters: {invalid_chars}")
-
-        reserved_names = {
-            "CON",
-            "PRN",
-            "AUX",
-            "NUL",
-            "COM1",
-            "COM2",
-            "COM3",
-            "COM4",
-            "COM5",
-            "COM6",
-            "COM7",
-            "COM8",
-            "COM9",
-            "LPT1",
-            "LPT2",
-            "LPT3",
-            "LPT4",
-            "LPT5",
-            "LPT6",
-            "LPT7",
-            "LPT8",
-            "LPT9",
-        }
+        if _WINDOWS_INVALID_CHARS_RE.search(path_str):
+            issues.append(
+                f"Path contains invalid characters: {_WINDOWS_INVALID_CHARS}"
+            )
+
+        reserved_names = _RESERVED_NAMES
         if custom_reserved_names:
-            reserved_names.update(custom_reserved_names)
+            reserved_names = reserved_names | set(custom_reserved_names)
 
         path = Path(path_str)
         for part in path.parts:
@@ -106,7 +99,7 @@ def is_valid_path(
     else:
         # Unix-like systems validation
         if strict_mode:
-            if re.search(r"//+", path_str):
+            if _CONSECUTIVE_SLASHES_RE.search(path_str):
                 issues.append("Path contains consecutive slashes.")
 
         if not allow_relative and not path_str.startswith("/"):
@@ -117,7 +110,7 @@ def is_valid_path(
         issues.append("Symlinks are not allowed.")
 
     if strict_mode:
-        if re.search(r"\s", path_str):
+        if _WHITESPACE_RE.search(path_str):
             issues.append("Path contains whitespace characters.")
 
     if issues:
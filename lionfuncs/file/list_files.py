@@ -1,5 +1,10 @@
+import fnmatch
+import os
+import re
 from pathlib import Path
 
+from lionfuncs.file.utils import walk_files
+
 
 def list_files(
     dir_path: Path | str, extension: str | None = None
@@ -22,5 +27,11 @@ def list_files(
     if not dir_path.is_dir():
         raise NotADirectoryError(f"{dir_path} is not a directory.")
 
-    pattern = f"*.{extension}" if extension else "*"
-    return [f for f in dir_path.rglob(pattern) if f.is_file()]
+    if not extension:
+        return [Path(entry.path) for entry in walk_files(dir_path)]
+
+    flags = re.IGNORECASE if os.name == "nt" else 0
+    match = re.compile(fnmatch.translate(f"*.{extension}"), flags).match
+    return [
+        Path(entry.path) for entry in walk_files(dir_path) if match(entry.name)
+    ]
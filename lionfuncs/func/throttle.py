@@ -4,8 +4,6 @@ import time
 from collections.abc import Callable
 from typing import Any, TypeVar
 
-from lionfuncs.utils import time as _t
-
 T = TypeVar("T")
 
 
@@ -30,7 +28,7 @@ class Throttle:
                 successive calls.
         """
         self.period = period
-        self.last_called = 0
+        self.last_called = float("-inf")
 
     def __call__(self, func: Callable[..., T]) -> Callable[..., T]:
         """
@@ -45,10 +43,10 @@ class Throttle:
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            elapsed = _t() - self.last_called
+            elapsed = time.monotonic() - self.last_called
             if elapsed < self.period:
                 time.sleep(self.period - elapsed)
-            self.last_called = _t()
+            self.last_called = time.monotonic()
             return func(*args, **kwargs)
 
         return wrapper
@@ -68,10 +66,10 @@ class Throttle:
 
         @functools.wraps(func)
         async def wrapper(*args, **kwargs) -> Any:
-            elapsed = _t() - self.last_called
+            elapsed = time.monotonic() - self.last_called
             if elapsed < self.period:
                 await asyncio.sleep(self.period - elapsed)
-            self.last_called = _t()
+            self.last_called = time.monotonic()
             return await func(*args, **kwargs)
 
         return wrapper
@@ -14,7 +14,22 @@ AlgorithmType = Literal[
 ]
 
 
+def _sequence_matcher_similarity(s1: str, s2: str) -> float:
+    return SequenceMatcher(None, s1, s2).ratio()
+
+
+SIMILARITY_ALGO_MAP: dict[str, Callable[[str, str], float]] = {
+    "jaro_winkler": jaro_winkler_similarity,
+    "levenshtein": levenshtein_similarity,
+    "sequence_matcher": _sequence_matcher_similarity,
+    "hamming": hamming_similarity,
+    "cosine": cosine_similarity,
+}
+
+
 class MatchResult:
+    __slots__ = ("word", "score", "index")
+
     def __init__(self, word: str, score: float, index: int):
         self.word = word
         self.score = score
@@ -135,18 +150,8 @@ def choose_most_similar(
     if not correct_words:
         raise ValueError("correct_words must not be empty")
 
-    algorithm_map: dict[str, Callable[[str, str], float]] = {
-        "jaro_winkler": jaro_winkler_similarity,
-        "levenshtein": levenshtein_similarity,
-        "sequence_matcher": lambda s1, s2: SequenceMatcher(
-            None, s1, s2
-        ).ratio(),
-        "hamming": hamming_similarity,
-        "cosine": cosine_similarity,
-    }
-
     if isinstance(algorithm, str):
-        score_func = algorithm_map.get(algorithm)
+        score_func = SIMILARITY_ALGO_MAP.get(algorithm)
         if score_func is None:
             raise ValueError(f"Unsupported algorithm: {algorithm}")
     elif callable(algorithm):
@@ -2,6 +2,13 @@
 
 from typing import Any
 
+TRUE_VALUES = frozenset({"true", "1", "correct", "yes"})
+FALSE_VALUES = frozenset({"false", "0", "incorrect", "no", "none", "n/a"})
+
+_BOOL_MAP: dict[str, bool] = {v: True for v in TRUE_VALUES} | {
+    v: False for v in FALSE_VALUES
+}
+
 
 def validate_boolean(x: Any) -> bool:
     """
@@ -36,20 +43,25 @@ def validate_boolean(x: Any) -> bool:
         >>> force_validate_boolean("0")
         False
     """
-    if isinstance(x, bool):
+    if type(x) is bool:
         return x
 
-    if str(x).strip().lower() in ["true", "1", "correct", "yes"]:
-        return True
-
-    elif str(x).strip().lower() in [
-        "false",
-        "0",
-        "incorrect",
-        "no",
-        "none",
-        "n/a",
-    ]:
-        return False
+    if type(x) is int and (x == 0 or x == 1):
+        return x == 1
+
+    if type(x) is str:
+        str_ = x
+    elif isinstance(x, bytes | bytearray):
+        str_ = x.decode("utf-8", errors="replace")
+    else:
+        str_ = str(x)
+
+    # Already-normalised tokens (e.g. JSON "true"/"false") skip the
+    # strip/lower allocations entirely.
+    result = _BOOL_MAP.get(str_)
+    if result is None:
+        result = _BOOL_MAP.get(str_.strip().lower())
+    if result is not None:
+        return result
 
     raise ValueError(f"Failed to convert {x} into a boolean value")
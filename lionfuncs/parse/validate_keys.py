@@ -1,4 +1,5 @@
 from collections.abc import Callable, Sequence
+from functools import lru_cache
 from typing import Any, Literal, TypedDict
 
 from lionfuncs.algo.jaro_distance import jaro_winkler_similarity
@@ -13,6 +14,12 @@ class KeysDict(TypedDict, total=False):
     key: Any  # Represents any key-type pair
 
 
+# The same schemas tend to be validated over and over (e.g. many model
+# outputs parsed into one pydantic model), so the default scorer memoizes
+# per (input_key, expected_key) pair.
+_cached_jaro_winkler = lru_cache(maxsize=4096)(jaro_winkler_similarity)
+
+
 def validate_keys(
     d_: dict[str, Any],
     keys: Sequence[str] | KeysDict,
@@ -24,6 +31,7 @@ def validate_keys(
     fill_value: Any = None,
     fill_mapping: dict[str, Any] | None = None,
     strict: bool = False,
+    case_insensitive: bool = False,
 ) -> dict[str, Any]:
     """
     Force-validate keys in a dictionary based on expected keys.
@@ -36,7 +44,7 @@ def validate_keys(
         dict_: The dictionary to validate and correct keys for.
         keys: List of expected keys or dictionary mapping keys to types.
         score_func: Function returning similarity score (0-1) for two
-            strings. Defaults to Jaro-Winkler similarity.
+            strings. Defaults to a memoized Jaro-Winkler similarity.
         fuzzy_match: If True, use fuzzy matching for key correction.
         handle_unmatched: Specifies how to handle unmatched keys:
             - "ignore": Keep unmatched keys in output.
@@ -47,6 +55,9 @@ def validate_keys(
         fill_value: Default value for filling unmatched keys.
         fill_mapping: Dictionary mapping unmatched keys to default values.
         strict: If True, raise ValueError if any expected key is missing.
+        case_insensitive: If True, match keys that differ only in case
+            before falling back to fuzzy matching. Output keys keep the
+            expected spelling. Non-string keys are only matched exactly.
 
     Returns:
         A new dictionary with validated and corrected keys.
@@ -55,75 +66,101 @@ def validate_keys(
         ValueError: If handle_unmatched is "raise" and unmatched keys
             exist, or if strict is True and expected keys are missing.
     """
-    fields_set = set(keys) if isinstance(keys, list) else set(keys.keys())
+    fields_set = set(keys)
 
     if strict:
         if any(k not in d_ for k in fields_set):
             raise ValueError(f"Failed to force_validate_keys for input: {d_}")
 
-    if set(d_.keys()) == fields_set:
+    if d_.keys() == fields_set:
         return d_
 
     if score_func is None:
-        score_func = jaro_winkler_similarity
-
-    corrected_out = {}
-    used_keys = set()
-    old_used_keys = set()
-
-    # TODO: need fixing, this logic is wrong
-    if fuzzy_match:
-        for k, v in d_.items():
-            if k in fields_set:
-                corrected_out[k] = v
-                fields_set.remove(k)  # Remove the matched key
-                used_keys.add(k)
-                old_used_keys.add(k)
-            else:
-                # Calculate scores
-                scores = [score_func(k, field) for field in fields_set]
-
-                # Check if scores list is empty
-                if not scores:
-                    break
-
-                # Find the index of the highest score
-                max_score_index = scores.index(max(scores))
-
-                # Select the best match based on the highest score
-                best_match = list(fields_set)[max_score_index]
-
-                corrected_out[best_match] = v
-                fields_set.remove(best_match)  # Remove the matched key
-                used_keys.add(best_match)
-                old_used_keys.add(k)
-
-        for k, v in d_.items():
-            if k not in old_used_keys:
-                corrected_out[k] = v
-
-        if len(used_keys) == len(d_) == fields_set:
-            return corrected_out
-
-    if handle_unmatched == "ignore":
-        return corrected_out
+        score_func = _cached_jaro_winkler
 
+    # Without fuzzy or case-insensitive matching no key is ever renamed, so
+    # the common modes reduce to a copy or a filter of the input.
+    if not fuzzy_match and not case_insensitive:
+        if handle_unmatched == "ignore":
+            return dict(d_)
+        if handle_unmatched == "remove":
+            return {k: v for k, v in d_.items() if k in fields_set}
+        if handle_unmatched == "raise":
+            if any(k not in fields_set for k in d_):
+                raise ValueError(
+                    f"Failed to force_validate_keys for input: {d_}"
+                )
+            return dict(d_)
+
+    # Claim exact matches first so a misspelled key earlier in the input
+    # cannot fuzzy-match onto an expected key present verbatim later on.
+    matched_input = {k for k in d_ if k in fields_set}
+    corrections: dict[str, str] = {}
+
+    # Unclaimed expected keys live in a fixed list (declaration order) with
+    # an availability mask, so claiming a key is a single byte write and
+    # ties resolve to the first-declared key.
+    expected_list = [f for f in dict.fromkeys(keys) if f not in matched_input]
+    available = bytearray(b"\x01") * len(expected_list)
+    n_available = len(expected_list)
+
+    if case_insensitive and n_available:
+        folded = {}
+        for i, f in enumerate(expected_list):
+            if isinstance(f, str):
+                folded.setdefault(f.lower(), i)
+        for k in d_:
+            if k in matched_input or not isinstance(k, str):
+                continue
+            i = folded.get(k.lower())
+            if i is not None and available[i]:
+                corrections[k] = expected_list[i]
+                available[i] = 0
+                n_available -= 1
+                matched_input.add(k)
+
+    # Nothing left to score once either side is fully matched.
+    if fuzzy_match and n_available and len(matched_input) < len(d_):
+        for k in d_:
+            if k in matched_input:
+                continue
+            if not n_available:
+                break
+
+            # Select the best match in a single pass over the fields
+            best_idx = max(
+                (i for i, a in enumerate(available) if a),
+                key=lambda i: score_func(k, expected_list[i]),
+            )
+            corrections[k] = expected_list[best_idx]
+            available[best_idx] = 0
+            n_available -= 1
+            matched_input.add(k)
+
+    rename = corrections.get
     if handle_unmatched in ["force", "remove"]:
-        for k in set(d_.keys()) - used_keys:
-            corrected_out.pop(k, None)
+        corrected_out = {
+            rename(k, k): v for k, v in d_.items() if k in matched_input
+        }
         if handle_unmatched == "remove":
             return corrected_out
+    else:
+        corrected_out = {rename(k, k): v for k, v in d_.items()}
+        if handle_unmatched == "ignore":
+            return corrected_out
 
     if handle_unmatched in ["force", "fill"]:
-        for k in fields_set - used_keys:
-            if fill_mapping:
-                corrected_out[k] = fill_mapping.get(k, fill_value)
-            else:
-                corrected_out[k] = fill_value
+        fill = fill_mapping.get if fill_mapping else {}.get
+        for k, a in zip(expected_list, available):
+            if a:
+                corrected_out[k] = fill(k, fill_value)
         if handle_unmatched == "fill":
             return corrected_out
 
     if handle_unmatched == "force":
         return corrected_out
 
+    if not d_.keys() - matched_input:
+        return corrected_out
+
     raise ValueError(f"Failed to force_validate_keys for input: {d_}")
@@ -1,19 +1,17 @@
 import re
-from collections.abc import Callable, Sequence
-from typing import Any, Literal, TypedDict, cast
+from collections.abc import Sequence
+from typing import Any
 
 from lionfuncs.parse.fuzzy_parse_json import fuzzy_parse_json
 from lionfuncs.parse.md_to_json import md_to_json
-from lionfuncs.parse.validate_keys import validate_keys
+from lionfuncs.parse.validate_keys import (
+    HandleUnmatched,
+    KeysDict,
+    ScoreFunc,
+    validate_keys,
+)
 
-ScoreFunc = Callable[[str, str], float]
-HandleUnmatched = Literal["ignore", "raise", "remove", "fill", "force"]
-
-
-class KeysDict(TypedDict, total=False):
-    """TypedDict for keys dictionary."""
-
-    key: Any  # Represents any key-type pair
+_JSON_CODEBLOCK_RE = re.compile(r"```(?:json)?\s*\n(.*?)\n\s*```", re.DOTALL)
 
 
 def validate_mapping(
@@ -27,6 +25,7 @@ def validate_mapping(
     fill_value: Any = None,
     fill_mapping: dict[str, Any] | None = None,
     strict: bool = False,
+    case_insensitive: bool = False,
 ) -> dict[str, Any]:
     """
     Validate and correct a mapping against a set of expected keys.
@@ -43,6 +42,8 @@ def validate_mapping(
         fill_value: Default value for filling unmatched keys.
         fill_mapping: Dictionary mapping unmatched keys to default values.
         strict: If True, raise ValueError if any expected key is missing.
+        case_insensitive: If True, match keys that differ only in case
+            before fuzzy matching. Non-string keys are only matched exactly.
 
     Returns:
         The validated and corrected dictionary.
@@ -57,11 +58,12 @@ def validate_mapping(
         >>> validated_dict
         {'name': 'John', 'age': 30, 'city': None}
     """
-    if isinstance(d, str):
-        d = _parse_string_to_dict(d)
+    if type(d) is not dict:
+        if isinstance(d, str):
+            d = _parse_string_to_dict(d)
 
-    if not isinstance(d, dict):
-        raise ValueError(f"Failed to convert input to dictionary: {d}")
+        if not isinstance(d, dict):
+            raise ValueError(f"Failed to convert input to dictionary: {d}")
 
     try:
         return validate_keys(
@@ -73,6 +75,7 @@ def validate_mapping(
             fill_value=fill_value,
             fill_mapping=fill_mapping,
             strict=strict,
+            case_insensitive=case_insensitive,
         )
     except Exception as e:
         raise ValueError(f"Failed to validate mapping for input: {d}") from e
@@ -91,12 +94,19 @@ def _parse_string_to_dict(s: str) -> dict[str, Any]:
     Raises:
         ValueError: If the string cannot be parsed into a dictionary.
     """
-    parsing_methods = [
-        lambda: fuzzy_parse_json(s),
-        lambda: md_to_json(s),
-        lambda: _extract_json_from_codeblock(s),
-        lambda: fuzzy_parse_json(s.replace("'", '"')),
-    ]
+    # Sniff the content so parsers that cannot produce a dict are never
+    # tried: the JSON parsers need a leading "{", the Markdown ones a fence.
+    is_json = s.lstrip().startswith("{")
+    has_codeblock = "```" in s
+
+    parsing_methods = []
+    if is_json:
+        parsing_methods.append(lambda: fuzzy_parse_json(s))
+    if has_codeblock:
+        parsing_methods.append(lambda: md_to_json(s))
+        parsing_methods.append(lambda: _extract_json_from_codeblock(s))
+    if is_json:
+        parsing_methods.append(lambda: fuzzy_parse_json(s.replace("'", '"')))
 
     for method in parsing_methods:
         try:
@@ -122,7 +132,7 @@ def _extract_json_from_codeblock(s: str) -> dict[str, Any]:
     Raises:
         ValueError: If no valid JSON is found in the code block.
     """
-    match = re.search(r"```(?:json)?\s*\n(.*?)\n\s*```", s, re.DOTALL)
+    match = _JSON_CODEBLOCK_RE.search(s)
     if match:
         json_str = match.group(1)
         result = fuzzy_parse_json(json_str)
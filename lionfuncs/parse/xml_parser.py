@@ -2,6 +2,11 @@ import re
 from typing import Any
 from xml.etree import ElementTree as ET
 
+_OPENING_TAG_RE = re.compile(r'<(\w+)((?:\s+\w+="[^"]*")*)\s*/?>')
+_CLOSING_TAG_RE = re.compile(r"</(\w+)>")
+_ATTRIBUTE_RE = re.compile(r'(\w+)="([^"]*)"')
+_WHITESPACE_RE = re.compile(r"\s*")
+
 
 def xml_to_dict(
     xml_string: str,
@@ -109,38 +114,29 @@ class XMLParser:
 
     def _parse_opening_tag(self) -> tuple[str, dict[str, str]]:
         """Parse an opening XML tag and its attributes."""
-        match = re.match(
-            r'<(\w+)((?:\s+\w+="[^"]*")*)\s*/?>',
-            self.xml_string[self.index :],  # noqa
-        )
+        match = _OPENING_TAG_RE.match(self.xml_string, self.index)
         if not match:
             raise ValueError("Invalid opening tag")
-        self.index += match.end()
+        self.index = match.end()
         tag = match.group(1)
-        attributes = dict(re.findall(r'(\w+)="([^"]*)"', match.group(2)))
+        attributes = dict(_ATTRIBUTE_RE.findall(match.group(2)))
         return tag, attributes
 
     def _parse_closing_tag(self) -> str:
         """Parse a closing XML tag."""
-        match = re.match(r"</(\w+)>", self.xml_string[self.index :])  # noqa
+        match = _CLOSING_TAG_RE.match(self.xml_string, self.index)
         if not match:
             raise ValueError("Invalid closing tag")
-        self.index += match.end()
+        self.index = match.end()
         return match.group(1)
 
     def _parse_text(self) -> str:
         """Parse text content between XML tags."""
         start = self.index
-        while (
-            self.index < len(self.xml_string)
-            and self.xml_string[self.index] != "<"
-        ):
-            self.index += 1
+        end = self.xml_string.find("<", start)
+        self.index = len(self.xml_string) if end == -1 else end
         return self.xml_string[start : self.index]  # noqa
 
     def _skip_whitespace(self) -> None:
         """Skip any whitespace characters at the current parsing position."""
-        p_ = len(self.xml_string[self.index :])  # noqa
-        m_ = len(self.xml_string[self.index :].lstrip())  # noqa
-
-        self.index += p_ - m_
+        self.index = _WHITESPACE_RE.match(self.xml_string, self.index).end()
@@ -9,7 +9,7 @@ import subprocess
 import sys
 from collections.abc import Mapping, Sequence
 from datetime import datetime, timezone
-from hashlib import sha256
+from secrets import token_hex
 from typing import Literal, TypeVar
 
 T = TypeVar("T")
@@ -17,9 +17,7 @@ T = TypeVar("T")
 
 def unique_hash(n: int = 32) -> str:
     """unique random hash"""
-    current_time = datetime.now().isoformat().encode("utf-8")
-    random_bytes = os.urandom(42)
-    return sha256(current_time + random_bytes).hexdigest()[:n]
+    return token_hex(32)[:n]
 
 
 def is_same_dtype(
@@ -25,6 +25,7 @@ from lionfuncs.data.utils import (
         (["a", "b", "c"], str, True),
         ([True, False, True], bool, True),
         ([1, 1.0, "1"], (int, float, str), True),
+        ([1, True, 3], int, True),
     ],
 )
 def test_is_homogeneous(input_data, type_check, expected):
@@ -46,6 +47,7 @@ def test_is_homogeneous(input_data, type_check, expected):
         ([1.0, 2.0, 3.0], float, True, (True, float)),
         (["a", "b", "c"], str, True, (True, str)),
         ([True, False, True], bool, True, (True, bool)),
+        ([1, True], int, True, (True, int)),
     ],
 )
 def test_is_same_dtype(input_data, dtype, return_dtype, expected):
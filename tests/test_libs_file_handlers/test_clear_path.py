@@ -0,0 +1,55 @@
+import pytest
+
+from lionfuncs.file.clear_path import clear_path
+
+
+@pytest.fixture
+def populated_dir(tmp_path):
+    for name in ["Keep.TXT", "keep.log", "remove.txt", "other.md"]:
+        (tmp_path / name).write_text("data")
+    sub = tmp_path / "subdir"
+    sub.mkdir()
+    (sub / "keep_nested.txt").write_text("data")
+    (sub / "drop_nested.txt").write_text("data")
+    return tmp_path
+
+
+def test_clear_path_removes_files(populated_dir):
+    clear_path(populated_dir)
+    assert sorted(p.name for p in populated_dir.iterdir()) == ["subdir"]
+
+
+def test_clear_path_recursive(populated_dir):
+    clear_path(populated_dir, recursive=True)
+    assert list(populated_dir.iterdir()) == []
+
+
+def test_clear_path_exclude(populated_dir):
+    clear_path(populated_dir, exclude=["keep", r"\.md$"])
+    assert sorted(p.name for p in populated_dir.iterdir()) == [
+        "keep.log",
+        "other.md",
+        "subdir",
+    ]
+
+
+def test_clear_path_exclude_with_inline_flag(populated_dir):
+    clear_path(populated_dir, exclude=["(?i)keep"])
+    assert sorted(p.name for p in populated_dir.iterdir()) == [
+        "Keep.TXT",
+        "keep.log",
+        "subdir",
+    ]
+
+
+def test_clear_path_recursive_exclude(populated_dir):
+    clear_path(populated_dir, recursive=True, exclude=["keep"])
+    remaining = sorted(
+        str(p.relative_to(populated_dir)) for p in populated_dir.rglob("*")
+    )
+    assert remaining == ["keep.log", "subdir", "subdir/keep_nested.txt"]
+
+
+def test_clear_path_missing_directory(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        clear_path(tmp_path / "missing")
@@ -0,0 +1,51 @@
+import os
+
+import pytest
+
+from lionfuncs.file.copy_file import copy_file
+
+
+def test_copy_file(tmp_path):
+    src = tmp_path / "src.txt"
+    src.write_text("content")
+    dest = tmp_path / "dest.txt"
+    copy_file(src, dest)
+    assert dest.read_text() == "content"
+
+
+def test_copy_file_creates_destination_directory(tmp_path):
+    src = tmp_path / "src.txt"
+    src.write_text("content")
+    dest = tmp_path / "nested" / "dir" / "dest.txt"
+    copy_file(str(src), str(dest))
+    assert dest.read_text() == "content"
+
+
+def test_copy_file_overwrites_destination(tmp_path):
+    src = tmp_path / "src.txt"
+    src.write_text("new")
+    dest = tmp_path / "dest.txt"
+    dest.write_text("old")
+    copy_file(src, dest)
+    assert dest.read_text() == "new"
+
+
+def test_copy_file_missing_source(tmp_path):
+    with pytest.raises(FileNotFoundError, match="is not a file"):
+        copy_file(tmp_path / "missing.txt", tmp_path / "dest.txt")
+    assert not (tmp_path / "dest.txt").exists()
+
+
+def test_copy_file_directory_source(tmp_path):
+    src = tmp_path / "src_dir"
+    src.mkdir()
+    with pytest.raises(FileNotFoundError, match="is not a file"):
+        copy_file(src, tmp_path / "dest")
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="requires mkfifo")
+def test_copy_file_fifo_source(tmp_path):
+    src = tmp_path / "pipe"
+    os.mkfifo(src)
+    with pytest.raises(FileNotFoundError, match="is not a file"):
+        copy_file(src, tmp_path / "dest")
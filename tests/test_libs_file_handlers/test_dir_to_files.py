@@ -0,0 +1,44 @@
+from pathlib import Path
+
+import pytest
+
+from lionfuncs.file.dir_to_files import dir_to_files
+
+
+@pytest.fixture
+def tree(tmp_path):
+    nested = tmp_path / "a" / "b"
+    nested.mkdir(parents=True)
+    (tmp_path / "top.txt").write_text("")
+    (tmp_path / "top.pdf").write_text("")
+    (tmp_path / "a" / "mid.txt").write_text("")
+    (nested / "deep.txt").write_text("")
+    (nested / "deep.md").write_text("")
+    return tmp_path
+
+
+def test_dir_to_files_all_types(tree):
+    result = dir_to_files(tree)
+    assert all(isinstance(p, Path) for p in result)
+    assert sorted(map(str, result)) == sorted(
+        str(tree / p)
+        for p in [
+            "top.txt",
+            "top.pdf",
+            "a/mid.txt",
+            "a/b/deep.txt",
+            "a/b/deep.md",
+        ]
+    )
+
+
+def test_dir_to_files_filters_by_type(tree):
+    result = dir_to_files(str(tree), file_types=[".txt"])
+    assert sorted(map(str, result)) == sorted(
+        str(tree / p) for p in ["top.txt", "a/mid.txt", "a/b/deep.txt"]
+    )
+
+
+def test_dir_to_files_invalid_directory(tree):
+    with pytest.raises(ValueError):
+        dir_to_files(tree / "top.txt")
@@ -0,0 +1,52 @@
+import os
+
+import pytest
+
+from lionfuncs.file.get_file_size import get_file_size
+
+
+def test_get_file_size_file(tmp_path):
+    file = tmp_path / "file.txt"
+    file.write_bytes(b"x" * 10)
+    assert get_file_size(file) == 10
+    assert get_file_size(str(file)) == 10
+
+
+def test_get_file_size_directory(tmp_path):
+    (tmp_path / "a.txt").write_bytes(b"x" * 10)
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    (sub / "b.txt").write_bytes(b"x" * 5)
+    assert get_file_size(tmp_path) == 15
+
+
+def test_get_file_size_empty_directory(tmp_path):
+    assert get_file_size(tmp_path) == 0
+
+
+def test_get_file_size_missing_path(tmp_path):
+    with pytest.raises(FileNotFoundError, match="does not exist"):
+        get_file_size(tmp_path / "missing")
+
+
+def test_get_file_size_path_under_file(tmp_path):
+    file = tmp_path / "file.txt"
+    file.write_text("data")
+    with pytest.raises(FileNotFoundError, match="does not exist"):
+        get_file_size(file / "sub")
+
+
+def test_get_file_size_path_with_nul_byte(tmp_path):
+    with pytest.raises(FileNotFoundError, match="does not exist"):
+        get_file_size(f"{tmp_path}/x\0y")
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="requires symlinks")
+def test_get_file_size_symlink_loop(tmp_path):
+    loop = tmp_path / "loop"
+    try:
+        loop.symlink_to(loop)
+    except OSError:
+        pytest.skip("symlinks not supported")
+    with pytest.raises(FileNotFoundError, match="does not exist"):
+        get_file_size(loop)
@@ -0,0 +1,74 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from lionfuncs.file.list_files import list_files
+
+
+def _sorted(paths: list[Path]) -> list[str]:
+    return sorted(str(p) for p in paths)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    nested = tmp_path / "pkg" / "sub"
+    nested.mkdir(parents=True)
+    (tmp_path / "setup.py").write_text("")
+    (tmp_path / "README.md").write_text("")
+    (tmp_path / "pkg" / "mod.py").write_text("")
+    (nested / "deep.py").write_text("")
+    (nested / "data.pyc").write_text("")
+    (nested / "notes.txt").write_text("")
+    return tmp_path
+
+
+def test_list_files_without_extension(tree):
+    result = list_files(tree)
+    assert all(isinstance(p, Path) for p in result)
+    assert _sorted(result) == sorted(
+        str(tree / p)
+        for p in [
+            "setup.py",
+            "README.md",
+            "pkg/mod.py",
+            "pkg/sub/deep.py",
+            "pkg/sub/data.pyc",
+            "pkg/sub/notes.txt",
+        ]
+    )
+
+
+def test_list_files_with_extension(tree):
+    assert _sorted(list_files(str(tree), "py")) == sorted(
+        str(tree / p) for p in ["setup.py", "pkg/mod.py", "pkg/sub/deep.py"]
+    )
+    assert _sorted(list_files(tree, "txt")) == [
+        str(tree / "pkg/sub/notes.txt")
+    ]
+    assert list_files(tree, "rs") == []
+
+
+@pytest.mark.skipif(os.name == "nt", reason="case-sensitive on POSIX only")
+def test_list_files_extension_is_case_sensitive(tree):
+    assert list_files(tree, "PY") == []
+    assert list_files(tree, "MD") == []
+    assert _sorted(list_files(tree, "md")) == [str(tree / "README.md")]
+
+
+def test_list_files_does_not_enter_directory_symlinks(tree, tmp_path_factory):
+    outside = tmp_path_factory.mktemp("outside")
+    (outside / "outside.py").write_text("")
+    try:
+        (tree / "linked").symlink_to(outside, target_is_directory=True)
+    except OSError:
+        pytest.skip("symlinks not supported")
+    assert not any("outside.py" in str(p) for p in list_files(tree))
+    assert not any("outside.py" in str(p) for p in list_files(tree, "py"))
+
+
+def test_list_files_not_a_directory(tree):
+    with pytest.raises(NotADirectoryError):
+        list_files(tree / "setup.py")
+    with pytest.raises(NotADirectoryError):
+        list_files(tree / "missing")
@@ -0,0 +1,93 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from lionfuncs.file.utils import walk_files
+
+
+def _rglob_files(root: Path) -> list[str]:
+    return sorted(str(p) for p in root.rglob("*") if p.is_file())
+
+
+def _walked(root: Path) -> list[str]:
+    return sorted(entry.path for entry in walk_files(root))
+
+
+@pytest.fixture
+def tree(tmp_path):
+    (tmp_path / "top.txt").write_text("top")
+    (tmp_path / ".hidden").write_text("hidden")
+    nested = tmp_path / "a" / "b"
+    nested.mkdir(parents=True)
+    (tmp_path / "a" / "mid.py").write_text("mid")
+    (nested / "deep.md").write_text("deep")
+    (nested / ".dotfile").write_text("dot")
+    (tmp_path / "empty").mkdir()
+    return tmp_path
+
+
+def test_walk_files_nested(tree):
+    assert _walked(tree) == sorted(
+        str(tree / p)
+        for p in [
+            "top.txt",
+            ".hidden",
+            "a/mid.py",
+            "a/b/deep.md",
+            "a/b/.dotfile",
+        ]
+    )
+    assert _walked(tree) == _rglob_files(tree)
+
+
+def test_walk_files_accepts_str(tree):
+    assert _walked(str(tree)) == _rglob_files(tree)
+
+
+def test_walk_files_yields_dir_entries(tree):
+    entries = list(walk_files(tree))
+    assert all(isinstance(entry, os.DirEntry) for entry in entries)
+    assert all(entry.is_file() for entry in entries)
+
+
+def test_walk_files_empty_directory(tmp_path):
+    assert list(walk_files(tmp_path)) == []
+
+
+@pytest.fixture
+def tree_with_symlinks(tree, tmp_path_factory):
+    outside = tmp_path_factory.mktemp("outside")
+    (outside / "outside.txt").write_text("outside")
+    try:
+        (tree / "file_link.txt").symlink_to(tree / "top.txt")
+        (tree / "dir_link").symlink_to(outside, target_is_directory=True)
+        (tree / "broken_link").symlink_to(tree / "missing.txt")
+    except OSError:
+        pytest.skip("symlinks not supported")
+    return tree
+
+
+def test_walk_files_symlinks(tree_with_symlinks):
+    walked = _walked(tree_with_symlinks)
+    assert str(tree_with_symlinks / "file_link.txt") in walked
+    assert str(tree_with_symlinks / "broken_link") not in walked
+    assert not any("outside.txt" in p for p in walked)
+    assert walked == _rglob_files(tree_with_symlinks)
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "geteuid") or os.geteuid() == 0,
+    reason="requires a non-root POSIX user",
+)
+def test_walk_files_skips_unreadable_directory(tree):
+    locked = tree / "locked"
+    locked.mkdir()
+    (locked / "secret.txt").write_text("secret")
+    locked.chmod(0)
+    try:
+        walked = _walked(tree)
+    finally:
+        locked.chmod(0o755)
+    assert str(locked / "secret.txt") not in walked
+    assert str(tree / "top.txt") in walked
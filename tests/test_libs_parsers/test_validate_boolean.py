@@ -0,0 +1,54 @@
+import pytest
+
+from lionfuncs.parse.validate_boolean import validate_boolean
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (True, True),
+        (False, False),
+        (1, True),
+        (0, False),
+        ("true", True),
+        ("  YES ", True),
+        ("Correct", True),
+        ("false", False),
+        ("No", False),
+        ("n/a", False),
+        ("none", False),
+        (" 0 ", False),
+    ],
+)
+def test_basic_values(value, expected):
+    assert validate_boolean(value) is expected
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (b"true", True),
+        (b" YES ", True),
+        (b"0", False),
+        (b"no", False),
+        (bytearray(b"TRUE"), True),
+        (bytearray(b" false "), False),
+    ],
+)
+def test_bytes_and_bytearray(value, expected):
+    assert validate_boolean(value) is expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    [b"\xff\xfe", bytearray(b"tru\xff"), b"maybe", bytearray()],
+)
+def test_invalid_bytes(value):
+    with pytest.raises(ValueError):
+        validate_boolean(value)
+
+
+@pytest.mark.parametrize("value", ["maybe", "", 2, -1, 0.5, [True]])
+def test_invalid_values(value):
+    with pytest.raises(ValueError):
+        validate_boolean(value)
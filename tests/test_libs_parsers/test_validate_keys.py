@@ -0,0 +1,210 @@
+import pytest
+
+from lionfuncs.parse.validate_keys import validate_keys
+
+EXPECTED = ["name", "age"]
+INPUT = {"name": 1, "agee": 2, "zzz": 3}
+
+
+@pytest.mark.parametrize(
+    "fuzzy_match, handle_unmatched, expected",
+    [
+        (True, "ignore", {"name": 1, "age": 2, "zzz": 3}),
+        (True, "remove", {"name": 1, "age": 2}),
+        (True, "fill", {"name": 1, "age": 2, "zzz": 3}),
+        (True, "force", {"name": 1, "age": 2}),
+        (False, "ignore", {"name": 1, "agee": 2, "zzz": 3}),
+        (False, "remove", {"name": 1}),
+        (False, "fill", {"name": 1, "agee": 2, "zzz": 3, "age": None}),
+        (False, "force", {"name": 1, "age": None}),
+    ],
+)
+def test_handle_unmatched_modes(fuzzy_match, handle_unmatched, expected):
+    result = validate_keys(
+        INPUT,
+        EXPECTED,
+        fuzzy_match=fuzzy_match,
+        handle_unmatched=handle_unmatched,
+    )
+    assert result == expected
+    assert list(result) == list(expected)
+
+
+@pytest.mark.parametrize("fuzzy_match", [True, False])
+def test_raise_on_unmatched_input(fuzzy_match):
+    with pytest.raises(ValueError):
+        validate_keys(
+            INPUT,
+            EXPECTED,
+            fuzzy_match=fuzzy_match,
+            handle_unmatched="raise",
+        )
+
+
+@pytest.mark.parametrize("fuzzy_match", [True, False])
+def test_raise_allows_missing_expected_keys(fuzzy_match):
+    result = validate_keys(
+        {"name": 1},
+        EXPECTED,
+        fuzzy_match=fuzzy_match,
+        handle_unmatched="raise",
+    )
+    assert result == {"name": 1}
+
+
+def test_raise_with_fuzzy_corrections():
+    result = validate_keys(
+        {"nmae": 1, "agee": 2}, EXPECTED, handle_unmatched="raise"
+    )
+    assert result == {"name": 1, "age": 2}
+
+
+def test_exact_match_takes_priority_over_fuzzy():
+    assert validate_keys({"nam": 1, "name": 2}, ["name"]) == {
+        "nam": 1,
+        "name": 2,
+    }
+    assert validate_keys(
+        {"nam": 1, "name": 2}, ["name"], handle_unmatched="remove"
+    ) == {"name": 2}
+    assert validate_keys(
+        {"nam": 1, "name": 2, "x": 3},
+        ["name", "x"],
+        handle_unmatched="remove",
+    ) == {"name": 2, "x": 3}
+
+
+def test_exact_keys_return_input():
+    d = {"name": 1, "age": 2}
+    assert validate_keys(d, EXPECTED) is d
+
+
+def test_fill_value_and_mapping():
+    result = validate_keys(
+        {"name": 1},
+        ["name", "age", "city"],
+        fuzzy_match=False,
+        handle_unmatched="fill",
+        fill_value=0,
+        fill_mapping={"city": "X"},
+    )
+    assert result == {"name": 1, "age": 0, "city": "X"}
+
+
+def test_fill_order_follows_declaration():
+    result = validate_keys(
+        {}, ["c", "a", "b"], fuzzy_match=False, handle_unmatched="fill"
+    )
+    assert list(result) == ["c", "a", "b"]
+
+
+def test_keys_as_tuple_and_dict():
+    assert validate_keys({"nmae": 1}, ("name",)) == {"name": 1}
+    assert validate_keys({"nmae": 1}, {"name": str}) == {"name": 1}
+
+
+def test_custom_score_func():
+    def score(a: str, b: str) -> float:
+        return 1.0 if b == "age" else 0.0
+
+    result = validate_keys({"foo": 1}, EXPECTED, score_func=score)
+    assert result == {"age": 1}
+
+
+def test_strict_missing_key():
+    with pytest.raises(ValueError):
+        validate_keys({"name": 1}, EXPECTED, strict=True)
+
+
+def test_case_insensitive_keeps_expected_spelling():
+    result = validate_keys(
+        {"Name": 1, "AGE": 2},
+        EXPECTED,
+        fuzzy_match=False,
+        case_insensitive=True,
+    )
+    assert result == {"name": 1, "age": 2}
+
+
+def test_case_insensitive_first_input_key_claims_match():
+    result = validate_keys(
+        {"NAME": 1, "Name": 2},
+        ["name"],
+        fuzzy_match=False,
+        case_insensitive=True,
+        handle_unmatched="ignore",
+    )
+    assert result == {"name": 1, "Name": 2}
+
+
+def test_case_insensitive_prefers_exact_match():
+    result = validate_keys(
+        {"Name": 1, "name": 2},
+        ["name"],
+        fuzzy_match=False,
+        case_insensitive=True,
+    )
+    assert result == {"Name": 1, "name": 2}
+
+
+@pytest.mark.parametrize(
+    "handle_unmatched, expected",
+    [
+        ("ignore", {"name": 1, "agee": 2}),
+        ("remove", {"name": 1}),
+        ("fill", {"name": 1, "agee": 2, "age": None}),
+        ("force", {"name": 1, "age": None}),
+    ],
+)
+def test_case_insensitive_without_fuzzy(handle_unmatched, expected):
+    result = validate_keys(
+        {"NAME": 1, "agee": 2},
+        EXPECTED,
+        fuzzy_match=False,
+        case_insensitive=True,
+        handle_unmatched=handle_unmatched,
+    )
+    assert result == expected
+
+
+def test_case_insensitive_without_fuzzy_raise():
+    assert validate_keys(
+        {"NAME": 1, "Age": 2},
+        EXPECTED,
+        fuzzy_match=False,
+        case_insensitive=True,
+        handle_unmatched="raise",
+    ) == {"name": 1, "age": 2}
+    with pytest.raises(ValueError):
+        validate_keys(
+            {"NAME": 1, "agee": 2},
+            EXPECTED,
+            fuzzy_match=False,
+            case_insensitive=True,
+            handle_unmatched="raise",
+        )
+
+
+def test_case_insensitive_falls_back_to_fuzzy():
+    result = validate_keys(
+        {"NAME": 1, "agee": 2}, EXPECTED, case_insensitive=True
+    )
+    assert result == {"name": 1, "age": 2}
+
+
+def test_case_insensitive_non_string_keys():
+    result = validate_keys(
+        {1: "a", "NAME": "b"},
+        [1, "name"],
+        fuzzy_match=False,
+        case_insensitive=True,
+    )
+    assert result == {1: "a", "name": "b"}
+    result = validate_keys(
+        {2: "a", "NAME": "b"},
+        [1, "name"],
+        fuzzy_match=False,
+        case_insensitive=True,
+        handle_unmatched="force",
+    )
+    assert result == {"name": "b", 1: None}
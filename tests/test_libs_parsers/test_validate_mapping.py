@@ -0,0 +1,88 @@
+import pytest
+
+from lionfuncs.parse.validate_mapping import validate_mapping
+
+
+def test_dict_input():
+    assert validate_mapping({"nmae": "John", "age": 30}, ["name", "age"]) == {
+        "name": "John",
+        "age": 30,
+    }
+
+
+@pytest.mark.parametrize(
+    "input_str",
+    [
+        '{"name": "John", "age": 30}',
+        "{'name': 'John', 'age': 30}",
+        '```json\n{"name": "John", "age": 30}\n```',
+        'Result:\n```\n{"name": "John", "age": 30}\n```',
+    ],
+)
+def test_string_input(input_str):
+    assert validate_mapping(input_str, ["name", "age"]) == {
+        "name": "John",
+        "age": 30,
+    }
+
+
+def test_fill_missing_keys():
+    result = validate_mapping(
+        "{'name': 'John', 'age': 30}",
+        ["name", "age", "city"],
+        handle_unmatched="fill",
+    )
+    assert result == {"name": "John", "age": 30, "city": None}
+
+
+@pytest.mark.parametrize(
+    "fuzzy_match, handle_unmatched, expected",
+    [
+        (True, "ignore", {"name": 1, "age": 2, "zzz": 3}),
+        (True, "remove", {"name": 1, "age": 2}),
+        (False, "ignore", {"name": 1, "agee": 2, "zzz": 3}),
+        (False, "remove", {"name": 1}),
+        (False, "force", {"name": 1, "age": None}),
+    ],
+)
+def test_passes_options_to_validate_keys(
+    fuzzy_match, handle_unmatched, expected
+):
+    result = validate_mapping(
+        {"name": 1, "agee": 2, "zzz": 3},
+        ["name", "age"],
+        fuzzy_match=fuzzy_match,
+        handle_unmatched=handle_unmatched,
+    )
+    assert result == expected
+
+
+def test_unparseable_string():
+    with pytest.raises(ValueError):
+        validate_mapping("not a mapping", ["name"])
+
+
+def test_non_dict_input():
+    with pytest.raises(ValueError):
+        validate_mapping([1, 2, 3], ["name"])
+
+
+def test_validation_failure_is_wrapped():
+    with pytest.raises(ValueError, match="Failed to validate mapping"):
+        validate_mapping(
+            {"name": 1, "zzz": 2},
+            ["name"],
+            fuzzy_match=False,
+            handle_unmatched="raise",
+        )
+
+
+def test_case_insensitive():
+    result = validate_mapping(
+        '{"Name": "John", "AGE": 30}',
+        ["name", "age"],
+        fuzzy_match=False,
+        case_insensitive=True,
+        handle_unmatched="raise",
+    )
+    assert result == {"name": "John", "age": 30}